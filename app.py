@@ -7,11 +7,12 @@ and an activity log. Designed for double-click-and-forget usage on Windows.
 import os
 import sys
 import time
+import select
 import socket
 import threading
 import queue
+import collections
 import tkinter as tk
-from datetime import datetime
 
 # Handle PyInstaller --windowed mode where stdout/stderr are None
 if getattr(sys, "frozen", False):
@@ -37,6 +38,7 @@ except ImportError:
 
 from controller_bridge import (
     rokoko_api,
+    rokoko_recently_ok,
     ROKOKO_BASE_URL,
     CALIBRATE_BUTTON,
     RECORD_BUTTON,
@@ -61,14 +63,25 @@ BORDER = "#414868"
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
 
-def check_rokoko_connection():
-    """Check if Rokoko Studio is reachable via TCP."""
+def check_rokoko_connection(timeout=0.25):
+    """Check if Rokoko Studio is reachable via TCP.
+
+    Uses a non-blocking connect with a short select budget so a dead
+    endpoint can't stall the caller for a full blocking-connect timeout.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
     try:
-        sock = socket.create_connection(("127.0.0.1", 14053), timeout=1)
-        sock.close()
-        return True
-    except (socket.timeout, socket.error, OSError):
+        if sock.connect_ex(("127.0.0.1", 14053)) == 0:
+            return True
+        _, writable, errored = select.select([], [sock], [sock], timeout)
+        if not writable and not errored:
+            return False
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    except OSError:
         return False
+    finally:
+        sock.close()
 
 
 # ── Application ────────────────────────────────────────────────────────────────
@@ -78,6 +91,15 @@ class App:
     def __init__(self):
         # Initialize pygame on the main thread (no visible window without set_mode)
         pygame.init()
+        # Drop axis/motion spam at the SDL layer — only events the app
+        # actually consumes can wake the event thread
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.JOYDEVICEADDED,
+            pygame.JOYDEVICEREMOVED,
+            pygame.JOYBUTTONDOWN,
+            pygame.QUIT,
+        ])
 
         self.root = tk.Tk()
         self.root.title("Rokoko Controller Bridge")
@@ -88,15 +110,41 @@ class App:
 
         self.msg_queue = queue.Queue()
         self.running = True
+        self._stop_event = threading.Event()
         self.joystick = None
-        self._last_times = {}
+        # Debounce timestamps indexed directly by button id — no dict
+        # hashing on the input path
+        self._last_times = [0.0] * (
+            max(CALIBRATE_BUTTON, RECORD_BUTTON, STOP_BUTTON) + 1
+        )
+
+        # Log lines queue up in a bounded ring buffer; the Text widget is
+        # refreshed from it at most every 100 ms instead of on every
+        # message, and a hidden window can't grow it past 500 entries
+        self._log_pending = collections.deque(maxlen=500)
+        self._ts_sec = -1
+        self._ts_str = ""
+        self._log_line_count = 0
+        self._log_dirty = False
+        self._last_flush = 0.0
+        self._flush_pending = False
 
         self._build_ui()
 
-        # Poll pygame events on the main thread (avoids SDL threading issues)
-        self._poll_controller()
-        # Poll the message queue for background-thread results
-        self._poll_queue()
+        # Background threads wake the Tk loop with a virtual event instead
+        # of the Tk loop polling the queue on a timer
+        self.root.bind("<<QueueMsg>>", self._drain_queue)
+
+        # Single worker thread serializes all Rokoko API calls (and with
+        # them access to the keep-alive connection)
+        self._work_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        # Block on SDL events in a background thread; the Tk thread only
+        # wakes when a controller event actually arrives
+        self._pg_thread = threading.Thread(
+            target=self._pygame_event_loop, daemon=True
+        )
+        self._pg_thread.start()
         # Rokoko connectivity check runs in a background thread
         threading.Thread(target=self._rokoko_check_loop, daemon=True).start()
 
@@ -180,15 +228,25 @@ class App:
             relief="flat",
             borderwidth=0,
             highlightthickness=0,
-            wrap="word",
+            wrap="none",
             state="disabled",
             cursor="arrow",
         )
         scrollbar = tk.Scrollbar(
             log_inner, command=self.log_text.yview, bg=CARD_BG, troughcolor=CARD_BG
         )
-        self.log_text.configure(yscrollcommand=scrollbar.set)
+        hbar = tk.Scrollbar(
+            log_inner,
+            orient="horizontal",
+            command=self.log_text.xview,
+            bg=CARD_BG,
+            troughcolor=CARD_BG,
+        )
+        self.log_text.configure(
+            yscrollcommand=scrollbar.set, xscrollcommand=hbar.set
+        )
         scrollbar.pack(side="right", fill="y")
+        hbar.pack(side="bottom", fill="x")
         self.log_text.pack(side="left", fill="both", expand=True)
 
         self.log_text.tag_configure("ts", foreground=TEXT_DIM)
@@ -196,6 +254,11 @@ class App:
         self.log_text.tag_configure("success", foreground=GREEN)
         self.log_text.tag_configure("error", foreground=RED)
 
+        # Catch up on anything logged while the window was hidden.
+        # Iconify/deiconify only generates Map events on the toplevel,
+        # not on child widgets, so bind there and filter.
+        self.root.bind("<Map>", self._on_root_mapped)
+
         self._add_log("Application started")
 
     def _make_card(self, parent, title):
@@ -251,16 +314,44 @@ class App:
     # ── Logging ────────────────────────────────────────────────────────────
 
     def _add_log(self, message, tag="info"):
-        ts = datetime.now().strftime("%H:%M:%S")
+        # Reuse the formatted timestamp for every message within the same
+        # second — bursts pay one strftime instead of one per line
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        ts = self._ts_str
+        # Keep lines short so the widget never has to wrap or scroll far
+        if len(message) > 80:
+            message = message[:79] + "\u2026"
+        # Store entries pre-assembled in the (text, tag, text, tag) form
+        # the Text insert takes, so flushing is a flatten plus one call
+        self._log_pending.append((f"{ts}  ", "ts", f"{message}\n", tag))
+        self._log_dirty = True
+
+    def _flush_log(self):
+        """Append pending log entries to the widget in one batched write."""
+        parts = [p for entry in self._log_pending for p in entry]
+        self._log_line_count += len(self._log_pending)
+        self._log_pending.clear()
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", f"{ts}  ", "ts")
-        self.log_text.insert("end", f"{message}\n", tag)
-        # Keep log trimmed to 500 lines
-        lines = int(self.log_text.index("end-1c").split(".")[0])
-        if lines > 500:
-            self.log_text.delete("1.0", f"{lines - 500}.0")
+        if parts:
+            self.log_text.insert("end", *parts)
+        # Trim in one bulk delete once 64 lines over budget, rather than
+        # asking Tcl for the line count on every append
+        if self._log_line_count > 564:
+            self.log_text.delete("1.0", f"{self._log_line_count - 500 + 1}.0")
+            self._log_line_count = 500
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
+        self._log_dirty = False
+        self._last_flush = time.monotonic()
+
+    def _on_root_mapped(self, event):
+        # bind on a toplevel also fires for its children; only act on the
+        # window itself being restored
+        if event.widget is self.root and self._log_dirty:
+            self._flush_log()
 
     # ── Status helpers ─────────────────────────────────────────────────────
 
@@ -268,109 +359,155 @@ class App:
         dot.configure(fg=color)
         val.configure(text=text, fg=color)
 
-    # ── Controller polling (main thread) ───────────────────────────────────
-
-    def _poll_controller(self):
-        if not self.running:
-            return
-
-        for event in pygame.event.get():
-            if event.type == pygame.JOYDEVICEADDED:
-                if self.joystick is None:
-                    try:
-                        self.joystick = pygame.joystick.Joystick(event.device_index)
-                        name = self.joystick.get_name()
-                        self._set_status(self.ctrl_dot, self.ctrl_val, name, GREEN)
-                        self._add_log(f"Controller connected: {name}", "success")
-                    except pygame.error:
-                        pass
-
-            elif event.type == pygame.JOYDEVICEREMOVED:
-                self.joystick = None
-                self._set_status(
-                    self.ctrl_dot, self.ctrl_val, "Searching\u2026", YELLOW
-                )
-                self._add_log("Controller disconnected", "error")
-
-            elif event.type == pygame.JOYBUTTONDOWN and self.joystick is not None:
-                btn = event.button
-                if btn not in (CALIBRATE_BUTTON, RECORD_BUTTON, STOP_BUTTON):
-                    continue
-                now = time.time()
-                if now - self._last_times.get(btn, 0) < DEBOUNCE_SECONDS:
-                    self._add_log("Debounced \u2014 ignoring repeated press")
-                    continue
-                self._last_times[btn] = now
-                # Run API call in a worker thread so the UI stays responsive
-                threading.Thread(
-                    target=self._handle_button, args=(btn,), daemon=True
-                ).start()
-
-        self.root.after(10, self._poll_controller)
-
-    # ── Button actions (run in worker threads) ─────────────────────────────
+    # ── Controller events (SDL thread → Tk thread) ───────────────────────────────────
+
+    def _pygame_event_loop(self):
+        """Block on SDL events and forward them to the Tk thread.
+
+        pygame event objects are not safe to share across threads, so only
+        the fields the UI needs are copied into a plain tuple.
+        """
+        while self.running:
+            try:
+                event = pygame.event.wait(1000)
+            except pygame.error:
+                # SDL was shut down underneath us
+                break
+            if event.type == pygame.NOEVENT:
+                continue
+            if event.type == pygame.QUIT or not self.running:
+                # Shutting down — exit without touching Tk, since the Tk
+                # thread is blocked in _on_close waiting to join us
+                break
+            self._post((
+                "pgevent",
+                event.type,
+                getattr(event, "button", None),
+                getattr(event, "device_index", None),
+            ))
+
+    def _handle_pg_event(self, etype, button, device_index):
+        """Dispatch a forwarded pygame event (runs on the Tk thread)."""
+        if etype == pygame.JOYDEVICEADDED:
+            if self.joystick is None:
+                try:
+                    self.joystick = pygame.joystick.Joystick(device_index)
+                    name = self.joystick.get_name()
+                    self._set_status(self.ctrl_dot, self.ctrl_val, name, GREEN)
+                    self._add_log(f"Controller connected: {name}", "success")
+                except pygame.error:
+                    pass
+
+        elif etype == pygame.JOYDEVICEREMOVED:
+            self.joystick = None
+            self._set_status(
+                self.ctrl_dot, self.ctrl_val, "Searching\u2026", YELLOW
+            )
+            self._add_log("Controller disconnected", "error")
+
+        elif etype == pygame.JOYBUTTONDOWN and self.joystick is not None:
+            btn = button
+            if btn not in (CALIBRATE_BUTTON, RECORD_BUTTON, STOP_BUTTON):
+                return
+            now = time.time()
+            if now - self._last_times[btn] < DEBOUNCE_SECONDS:
+                self._add_log("Debounced \u2014 ignoring repeated press")
+                return
+            self._last_times[btn] = now
+            # Hand the API call to the worker thread so the UI stays
+            # responsive
+            self._work_q.put(btn)
+
+    # ── Button actions (run on the worker thread) ──────────────────────────
+
+    def _worker_loop(self):
+        while self.running:
+            job = self._work_q.get()
+            if job is None:
+                break
+            if job == "probe":
+                # An API call queued ahead of us may have just proven
+                # reachability, so re-check before opening a socket
+                connected = rokoko_recently_ok() or check_rokoko_connection()
+                self._post(("rokoko", connected))
+            else:
+                self._handle_button(job)
 
     def _handle_button(self, button):
         if button == CALIBRATE_BUTTON:
-            self.msg_queue.put(("log", "Triangle \u2192 Calibrating (3 s countdown)\u2026", "info"))
-            code, status, desc = rokoko_api(
-                "calibrate",
-                {
-                    "countdown_delay": 3,
-                    "skip_suit": False,
-                    "skip_gloves": False,
-                    "use_custom_pose": False,
-                    "pose": "straight-arms-down",
-                },
-            )
+            self._post(("log", "Triangle \u2192 Calibrating (3 s countdown)\u2026", "info"))
+            code, status, desc = rokoko_api("calibrate")
             if code == 0:
-                self.msg_queue.put(("log", f"Calibration OK: {desc}", "success"))
+                self._post(("log", f"Calibration OK: {desc}", "success"))
             elif code is None:
-                self.msg_queue.put(
+                self._post(
                     ("log", "Calibration failed \u2014 Rokoko unreachable", "error")
                 )
             else:
-                self.msg_queue.put(("log", f"Calibration: {status} \u2014 {desc}", "error"))
+                self._post(("log", f"Calibration: {status} \u2014 {desc}", "error"))
 
         elif button == RECORD_BUTTON:
-            self.msg_queue.put(("log", "Cross \u2192 Starting recording\u2026", "info"))
-            code, status, desc = rokoko_api("recording/start", {"filename": ""})
+            self._post(("log", "Cross \u2192 Starting recording\u2026", "info"))
+            code, status, desc = rokoko_api("recording/start")
             if code == 0:
-                self.msg_queue.put(("log", "Recording started", "success"))
-                self.msg_queue.put(("recording", True))
+                self._post(("log", "Recording started", "success"))
+                self._post(("recording", True))
             elif code is None:
-                self.msg_queue.put(
+                self._post(
                     ("log", "Record failed \u2014 Rokoko unreachable", "error")
                 )
             else:
-                self.msg_queue.put(("log", f"Record: {status} \u2014 {desc}", "error"))
+                self._post(("log", f"Record: {status} \u2014 {desc}", "error"))
 
         elif button == STOP_BUTTON:
-            self.msg_queue.put(("log", "Circle \u2192 Stopping recording\u2026", "info"))
-            code, status, desc = rokoko_api(
-                "recording/stop", {"back_to_live": True}
-            )
+            self._post(("log", "Circle \u2192 Stopping recording\u2026", "info"))
+            code, status, desc = rokoko_api("recording/stop")
             if code == 0:
-                self.msg_queue.put(("log", "Recording stopped", "success"))
-                self.msg_queue.put(("recording", False))
+                self._post(("log", "Recording stopped", "success"))
+                self._post(("recording", False))
             elif code is None:
-                self.msg_queue.put(
+                self._post(
                     ("log", "Stop failed \u2014 Rokoko unreachable", "error")
                 )
             else:
-                self.msg_queue.put(("log", f"Stop: {status} \u2014 {desc}", "error"))
+                self._post(("log", f"Stop: {status} \u2014 {desc}", "error"))
 
     # ── Rokoko connectivity (background thread) ───────────────────────────
 
     def _rokoko_check_loop(self):
+        # Deadline-based schedule so a slow probe doesn't skew the 3 s
+        # cadence; Event.wait instead of time.sleep so the wait is
+        # interruptible
+        deadline = time.monotonic()
         while self.running:
-            connected = check_rokoko_connection()
-            self.msg_queue.put(("rokoko", connected))
-            time.sleep(3)
+            deadline += 3.0
+            if rokoko_recently_ok():
+                # A recent successful API call already proves
+                # reachability — no socket work needed
+                self._post(("rokoko", True))
+            else:
+                # Probe on the worker thread so it serializes with API
+                # calls instead of racing them for sockets
+                self._work_q.put("probe")
+            self._stop_event.wait(max(0, deadline - time.monotonic()))
 
     # ── Queue processing (main thread) ─────────────────────────────────────
 
-    def _poll_queue(self):
+    def _post(self, msg):
+        """Enqueue a message and wake the Tk loop to drain it.
+
+        Safe to call from any thread; event_generate is the documented
+        thread-safe way to poke the Tk event loop.
+        """
+        self.msg_queue.put(msg)
+        try:
+            self.root.event_generate("<<QueueMsg>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # TclError when the interpreter is being torn down;
+            # RuntimeError when the Tk main loop isn't running
+            pass
+
+    def _drain_queue(self, _event=None):
         try:
             while True:
                 msg = self.msg_queue.get_nowait()
@@ -379,6 +516,9 @@ class App:
                 if kind == "log":
                     self._add_log(msg[1], msg[2] if len(msg) > 2 else "info")
 
+                elif kind == "pgevent":
+                    self._handle_pg_event(msg[1], msg[2], msg[3])
+
                 elif kind == "rokoko":
                     if msg[1]:
                         self._set_status(
@@ -402,13 +542,40 @@ class App:
         except queue.Empty:
             pass
 
-        if self.running:
-            self.root.after(50, self._poll_queue)
+        if self._log_dirty and self._log_visible():
+            since = time.monotonic() - self._last_flush
+            if since >= 0.1:
+                self._flush_log()
+            elif not self._flush_pending:
+                # Respect the 100 ms flush budget with a one-shot timer
+                # instead of a standing poll
+                self._flush_pending = True
+                self.root.after(
+                    int((0.1 - since) * 1000) + 1, self._deferred_flush
+                )
+
+    def _log_visible(self):
+        return self.log_text.winfo_viewable() and self.root.state() != "iconic"
+
+    def _deferred_flush(self):
+        self._flush_pending = False
+        if self._log_dirty and self._log_visible():
+            self._flush_log()
 
     # ── Lifecycle ──────────────────────────────────────────────────────────
 
     def _on_close(self):
         self.running = False
+        # Wake the check loop out of its 3 s wait so it exits immediately
+        self._stop_event.set()
+        self._work_q.put(None)
+        # Unblock the SDL event thread and let it exit before tearing
+        # SDL down underneath an active wait
+        try:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        except pygame.error:
+            pass
+        self._pg_thread.join(timeout=1.0)
         pygame.quit()
         self.root.destroy()
 
@@ -1,7 +1,7 @@
 import os
 import time
-import urllib.request
-import urllib.error
+import http.client
+import socket
 import json
 
 try:
@@ -20,7 +20,9 @@ if ICLONE_ENABLED:
         raise SystemExit(1)
 
 ROKOKO_API_KEY = "1234"
-ROKOKO_BASE_URL = f"http://127.0.0.1:14053/v1/{ROKOKO_API_KEY}"
+ROKOKO_HOST = "127.0.0.1"
+ROKOKO_PORT = 14053
+ROKOKO_BASE_URL = f"http://{ROKOKO_HOST}:{ROKOKO_PORT}/v1/{ROKOKO_API_KEY}"
 
 # PlayStation button indices (typical DualShock/DualSense mapping via pygame)
 CALIBRATE_BUTTON = 3  # Triangle
@@ -42,24 +44,83 @@ RESPONSE_CODES = {
 }
 
 
+# Payloads for the three known commands, JSON-encoded once at import so a
+# button press is just a socket write
+_PAYLOADS = {
+    "calibrate": json.dumps({
+        "countdown_delay": 3,
+        "skip_suit": False,
+        "skip_gloves": False,
+        "use_custom_pose": False,
+        "pose": "straight-arms-down",
+    }).encode("utf-8"),
+    "recording/start": json.dumps({"filename": ""}).encode("utf-8"),
+    "recording/stop": json.dumps({"back_to_live": True}).encode("utf-8"),
+}
+_PATHS = {cmd: f"/v1/{ROKOKO_API_KEY}/{cmd}" for cmd in _PAYLOADS}
+
+# Keep-alive connection reused across calls so each button press pays one
+# round trip instead of a TCP handshake plus the request. Callers are
+# expected to serialize access: the CLI is single-threaded and the GUI
+# funnels all API calls through one worker thread.
+_conn = None
+
+# Monotonic time of the last successful API round trip; lets callers treat
+# a recent success as proof of reachability without opening a probe socket
+_last_ok_time = 0.0
+
+
+def rokoko_recently_ok(window=3.0):
+    """True if a Rokoko API call completed within the last `window` seconds."""
+    return time.monotonic() - _last_ok_time < window
+
+
+def _rokoko_request(command, data):
+    """POST over the pooled connection, rebuilding it once if it went stale.
+
+    Returns the fully drained response body so a failure at any point —
+    including mid-body — drops the connection rather than leaving it with
+    a half-read response that would poison every later call.
+    """
+    global _conn
+    path = _PATHS.get(command) or f"/v1/{ROKOKO_API_KEY}/{command}"
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+    for retry in (True, False):
+        try:
+            if _conn is None:
+                _conn = http.client.HTTPConnection(ROKOKO_HOST, ROKOKO_PORT, timeout=5)
+                _conn.connect()
+                # Disable Nagle so the small POST frame goes out immediately
+                # instead of waiting to be coalesced
+                _conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            _conn.request("POST", path, body=data, headers=headers)
+            return _conn.getresponse().read()
+        except (http.client.HTTPException, OSError):
+            # Server closed the idle connection, stalled mid-response, or
+            # it never existed — drop the connection and try a fresh one
+            if _conn is not None:
+                _conn.close()
+                _conn = None
+            if not retry:
+                raise
+
+
 def rokoko_api(command, payload=None):
-    url = f"{ROKOKO_BASE_URL}/{command}"
-    data = json.dumps(payload or {}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    global _last_ok_time
+    if payload is None:
+        data = _PAYLOADS.get(command, b"{}")
+    else:
+        data = json.dumps(payload).encode("utf-8")
     try:
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            body = json.loads(resp.read())
-            code = body.get("response_code")
-            desc = body.get("description", "")
-            status = RESPONSE_CODES.get(code, f"UNKNOWN ({code})")
-            return code, status, desc
-    except urllib.error.URLError as e:
-        print(f"Error: Rokoko Studio is unreachable — {e.reason}")
+        raw = _rokoko_request(command, data)
+        _last_ok_time = time.monotonic()
+        body = json.loads(raw)
+        code = body.get("response_code")
+        desc = body.get("description", "")
+        status = RESPONSE_CODES.get(code, f"UNKNOWN ({code})")
+        return code, status, desc
+    except OSError as e:
+        print(f"Error: Rokoko Studio is unreachable — {e}")
         return None, None, None
     except Exception as e:
         print(f"Error sending {command} request: {e}")
@@ -67,13 +128,7 @@ def rokoko_api(command, payload=None):
 
 
 def send_calibrate():
-    code, status, desc = rokoko_api("calibrate", {
-        "countdown_delay": 3,
-        "skip_suit": False,
-        "skip_gloves": False,
-        "use_custom_pose": False,
-        "pose": "straight-arms-down",
-    })
+    code, status, desc = rokoko_api("calibrate")
     if code is None:
         return
     if code == 0:
@@ -83,7 +138,7 @@ def send_calibrate():
 
 
 def rokoko_start_recording():
-    code, status, desc = rokoko_api("recording/start", {"filename": ""})
+    code, status, desc = rokoko_api("recording/start")
     if code is None:
         return
     if code == 0:
@@ -93,7 +148,7 @@ def rokoko_start_recording():
 
 
 def rokoko_stop_recording():
-    code, status, desc = rokoko_api("recording/stop", {"back_to_live": True})
+    code, status, desc = rokoko_api("recording/stop")
     if code is None:
         return
     if code == 0:
@@ -125,6 +180,10 @@ def main():
 
     pygame.init()
     pygame.joystick.init()
+    # Drop axis/motion spam at the SDL layer so the event wait only wakes
+    # on button presses
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.JOYBUTTONDOWN, pygame.QUIT])
 
     if pygame.joystick.get_count() == 0:
         print("No controller detected. Connect a PlayStation controller and try again.")
@@ -146,7 +205,14 @@ def main():
 
     try:
         while True:
-            for event in pygame.event.get():
+            # Block until an event arrives (1 s timeout so Ctrl+C stays
+            # responsive) instead of polling at 100 Hz with time.sleep.
+            first = pygame.event.wait(1000)
+            if first.type == pygame.NOEVENT:
+                continue
+            events = [first]
+            events.extend(pygame.event.get())
+            for event in events:
                 if event.type != pygame.JOYBUTTONDOWN:
                     continue
                 now = time.time()
@@ -177,8 +243,6 @@ def main():
                     if ICLONE_ENABLED:
                         pyautogui.press("space")
                         print("iClone stop recording (spacebar pressed)")
-
-            time.sleep(0.01)
     except KeyboardInterrupt:
         print("\nStopped.")
     finally: